@@ -1,73 +1,221 @@
 import asyncio
-import json
+import functools
+import inspect
+import logging
+import operator
 import os
+import queue
 import random
+import sys
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from enum import Enum
+from logging.handlers import QueueHandler, QueueListener
 
+import orjson
 import pandas as pd
 import yfinance as yf
+from diskcache import Cache
 from fastmcp import FastMCP
 
 
-# --- Basic rate limiting & caching to reduce Yahoo throttling ---
-_GLOBAL_WINDOW_SECONDS = float(os.getenv("YFINANCE_RATE_WINDOW_SECONDS", "60"))
-_GLOBAL_MAX_REQUESTS = int(os.getenv("YFINANCE_MAX_REQUESTS_PER_WINDOW", "30"))
-_PER_TICKER_MIN_INTERVAL_SECONDS = float(
-    os.getenv("YFINANCE_MIN_TICKER_INTERVAL_SECONDS", "2")
-)
-_CACHE_TTL_SECONDS = float(os.getenv("YFINANCE_CACHE_TTL_SECONDS", "60"))
-_MAX_RETRIES = int(os.getenv("YFINANCE_MAX_RETRIES", "2"))
-_BACKOFF_BASE_SECONDS = float(os.getenv("YFINANCE_BACKOFF_BASE_SECONDS", "1.5"))
+# Diagnostics go through a queue so formatting and stderr I/O happen off
+# the event-loop thread instead of blocking it on every error
+logger = logging.getLogger("yfinance_mcp")
+logger.setLevel(logging.INFO)
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+logger.addHandler(QueueHandler(_log_queue))
+_stderr_handler = logging.StreamHandler(sys.stderr)
+_stderr_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+_log_listener = QueueListener(_log_queue, _stderr_handler)
+_log_listener.start()
 
-_global_request_timestamps: list[float] = []
-_last_ticker_request: dict[str, float] = {}
-_cache: dict[tuple, tuple[float, str]] = {}
 
+# --- Basic rate limiting & caching to reduce Yahoo throttling ---
+@dataclass(frozen=True, slots=True)
+class _Config:
+    """Tunables read from the environment once at import.
+
+    Hot functions bind this to a local first so the per-call attribute
+    reads are slot lookups instead of repeated module-global lookups.
+    """
 
-def _prune_global_timestamps(now: float) -> None:
-    cutoff = now - _GLOBAL_WINDOW_SECONDS
-    while _global_request_timestamps and _global_request_timestamps[0] < cutoff:
-        _global_request_timestamps.pop(0)
+    window_seconds: float = float(os.getenv("YFINANCE_RATE_WINDOW_SECONDS", "60"))
+    max_requests: int = int(os.getenv("YFINANCE_MAX_REQUESTS_PER_WINDOW", "30"))
+    min_ticker_interval: float = float(os.getenv("YFINANCE_MIN_TICKER_INTERVAL_SECONDS", "2"))
+    cache_ttl: float = float(os.getenv("YFINANCE_CACHE_TTL_SECONDS", "60"))
+    neg_cache_ttl: float = float(os.getenv("YFINANCE_NEG_CACHE_TTL", "300"))
+    max_retries: int = int(os.getenv("YFINANCE_MAX_RETRIES", "2"))
+    backoff_base: float = float(os.getenv("YFINANCE_BACKOFF_BASE_SECONDS", "1.5"))
+    backoff_cap: float = float(os.getenv("YFINANCE_BACKOFF_CAP_SECONDS", "60"))
+    thread_pool_workers: int = int(os.getenv("YFINANCE_THREAD_POOL_WORKERS", "8"))
+    cache_dir: str = os.getenv("YFINANCE_CACHE_DIR", "/tmp/yfinance-mcp")
+    cache_size_limit_bytes: int = int(os.getenv("YFINANCE_CACHE_SIZE_LIMIT_BYTES", str(10**9)))
+
+
+_CFG = _Config()
+_GLOBAL_REFILL_RATE = _CFG.max_requests / _CFG.window_seconds
+_TICKER_TRACKING_MAX_ENTRIES = 10_000
+# Much tighter than the timestamp bound above: each cached Ticker retains
+# the payloads it has fetched, so thousands of them would hold GBs of RAM
+_TICKER_CACHE_MAX_ENTRIES = 256
+
+_tokens: float = float(_CFG.max_requests)
+_last_refill: float = time.monotonic()
+_last_ticker_request: OrderedDict[str, float] = OrderedDict()
+# SQLite-backed cache survives restarts and is shared between worker
+# processes; diskcache handles TTL expiry and size-based eviction itself
+_cache = Cache(_CFG.cache_dir, size_limit=_CFG.cache_size_limit_bytes)
+_inflight: dict[tuple, asyncio.Future] = {}
+
+# yfinance's YfData singleton already shares one pooled curl_cffi session
+# across all Ticker objects, so calls reuse warm TCP connections; caching
+# the Ticker objects themselves avoids re-running their setup per call
+_ticker_cache: OrderedDict[str, yf.Ticker] = OrderedDict()
+
+
+def _get_ticker(ticker: str) -> yf.Ticker:
+    company = _ticker_cache.get(ticker)
+    if company is None:
+        company = yf.Ticker(ticker)
+        _ticker_cache[ticker] = company
+    _ticker_cache.move_to_end(ticker)
+    while len(_ticker_cache) > _TICKER_CACHE_MAX_ENTRIES:
+        _ticker_cache.popitem(last=False)
+    return company
 
 
-def _rate_limit_check(ticker: str) -> tuple[bool, str | None]:
+def _rate_limit_check(*tickers: str) -> tuple[bool, str | None]:
+    global _tokens, _last_refill
+    cfg = _CFG
+    refill_rate = _GLOBAL_REFILL_RATE
     now = time.monotonic()
 
-    # Global window limit
-    _prune_global_timestamps(now)
-    if len(_global_request_timestamps) >= _GLOBAL_MAX_REQUESTS:
-        retry_after = _GLOBAL_WINDOW_SECONDS - (now - _global_request_timestamps[0])
+    # Global token bucket: refill based on elapsed time, admit if a token is available
+    _tokens = min(float(cfg.max_requests), _tokens + (now - _last_refill) * refill_rate)
+    _last_refill = now
+    if _tokens < 1.0:
+        retry_after = (1.0 - _tokens) / refill_rate
         return True, f"Rate limited. Try after {retry_after:.1f}s."
 
-    # Per-ticker minimum interval
-    last = _last_ticker_request.get(ticker)
-    if last is not None:
-        elapsed = now - last
-        if elapsed < _PER_TICKER_MIN_INTERVAL_SECONDS:
-            retry_after = _PER_TICKER_MIN_INTERVAL_SECONDS - elapsed
-            return True, f"Rate limited. Try after {retry_after:.1f}s."
-
-    _global_request_timestamps.append(now)
-    _last_ticker_request[ticker] = now
+    # Per-ticker minimum interval; a batch is limited if any of its tickers is
+    for ticker in tickers:
+        last = _last_ticker_request.get(ticker)
+        if last is not None:
+            elapsed = now - last
+            if elapsed < cfg.min_ticker_interval:
+                retry_after = cfg.min_ticker_interval - elapsed
+                return True, f"Rate limited. Try after {retry_after:.1f}s."
+
+    _tokens -= 1.0
+    for ticker in tickers:
+        _last_ticker_request[ticker] = now
+        _last_ticker_request.move_to_end(ticker)
+    while len(_last_ticker_request) > _TICKER_TRACKING_MAX_ENTRIES:
+        _last_ticker_request.popitem(last=False)
     return False, None
 
 
-def _cache_get(cache_key: tuple) -> str | None:
-    now = time.monotonic()
-    cached = _cache.get(cache_key)
-    if not cached:
-        return None
-    expires_at, value = cached
-    if now >= expires_at:
-        _cache.pop(cache_key, None)
-        return None
-    return value
+# diskcache reads and writes are synchronous SQLite I/O, so they run off the
+# event loop — on a dedicated pool, not the fetch executor, so cache hits do
+# not queue behind slow Yahoo calls when that pool is saturated
+_cache_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="yfinance-cache")
+
+
+async def _cache_get(cache_key: tuple) -> str | None:
+    return await asyncio.get_running_loop().run_in_executor(_cache_executor, _cache.get, cache_key)
 
 
-def _cache_set(cache_key: tuple, value: str) -> None:
-    expires_at = time.monotonic() + _CACHE_TTL_SECONDS
-    _cache[cache_key] = (expires_at, value)
+async def _cache_set(cache_key: tuple, value: str, ttl: float = _CFG.cache_ttl) -> None:
+    await asyncio.get_running_loop().run_in_executor(
+        _cache_executor, functools.partial(_cache.set, cache_key, value, expire=ttl)
+    )
+
+
+async def _cache_set_negative(cache_key: tuple, value: str) -> None:
+    """Cache a not-found/empty result briefly so bad tickers do not hit Yahoo repeatedly."""
+    await _cache_set(cache_key, value, ttl=_CFG.neg_cache_ttl)
+
+
+class _NegativeResult(Exception):
+    """Raised by a tool body when Yahoo has no data; the message is returned and negative-cached."""
+
+
+def _cached_tool(error_context: str):
+    """Wrap a tool body with the shared cache, rate-limit and error scaffolding.
+
+    The decorated coroutine only performs the fetch and returns the result
+    string (or raises _NegativeResult); cache lookup, single-flight
+    coalescing, rate limiting, negative caching and error formatting all
+    live here instead of being repeated in every tool.
+    """
+
+    def decorator(impl):
+        signature = inspect.signature(impl)
+
+        @functools.wraps(impl)
+        async def wrapper(*args, **kwargs) -> str:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            ticker = bound.arguments["ticker"]
+            cache_key = (impl.__name__, *bound.arguments.values())
+
+            async def _fetch() -> str:
+                rate_limited, message = _rate_limit_check(ticker)
+                if rate_limited:
+                    return message or "Rate limited. Try after a while."
+                try:
+                    result = await impl(*bound.args, **bound.kwargs)
+                except _NegativeResult as exc:
+                    logger.warning(str(exc))
+                    await _cache_set_negative(cache_key, str(exc))
+                    return str(exc)
+                except Exception as e:
+                    logger.warning(f"Error: {error_context} for {ticker}: {e}")
+                    return f"Error: {error_context} for {ticker}: {e}"
+                if not result.startswith("Error:"):
+                    await _cache_set(cache_key, result)
+                return result
+
+            return await _cached_or_fetch(cache_key, _fetch)
+
+        return wrapper
+
+    return decorator
+
+
+async def _cached_or_fetch(cache_key: tuple, fetch) -> str:
+    """Return the cached value for cache_key, coalescing concurrent fetches.
+
+    Only the first caller for a given key runs fetch; concurrent callers
+    await the same in-flight future instead of issuing duplicate upstream
+    requests.
+    """
+    cached = await _cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    existing = _inflight.get(cache_key)
+    if existing is not None:
+        return await existing
+
+    future: asyncio.Future = asyncio.get_event_loop().create_future()
+    _inflight[cache_key] = future
+    try:
+        result = await fetch()
+        future.set_result(result)
+        return result
+    except Exception as exc:
+        future.set_exception(exc)
+        raise
+    finally:
+        _inflight.pop(cache_key, None)
+        # Cancellation is a BaseException and skips the handler above; cancel
+        # the future too so coalesced waiters are released instead of hanging
+        if not future.done():
+            future.cancel()
 
 
 def _is_rate_limited_error(exc: Exception) -> bool:
@@ -75,17 +223,25 @@ def _is_rate_limited_error(exc: Exception) -> bool:
     return "too many requests" in message or "rate limited" in message
 
 
+# Blocking yfinance calls run here so they do not stall the event loop
+_executor = ThreadPoolExecutor(max_workers=_CFG.thread_pool_workers, thread_name_prefix="yfinance")
+
+
 async def _execute_with_retry(fetcher, *args, **kwargs):
+    cfg = _CFG
     last_error = None
-    for attempt in range(_MAX_RETRIES + 1):
+    # Decorrelated jitter spreads retries instead of synchronized doubling waves
+    backoff = cfg.backoff_base
+    for attempt in range(cfg.max_retries + 1):
         try:
-            return fetcher(*args, **kwargs)
+            return await asyncio.get_running_loop().run_in_executor(
+                _executor, functools.partial(fetcher, *args, **kwargs)
+            )
         except Exception as exc:
             last_error = exc
-            if not _is_rate_limited_error(exc) or attempt >= _MAX_RETRIES:
+            if not _is_rate_limited_error(exc) or attempt >= cfg.max_retries:
                 raise
-            backoff = _BACKOFF_BASE_SECONDS * (2**attempt)
-            backoff += random.uniform(0, 0.3 * backoff)
+            backoff = min(cfg.backoff_cap, random.uniform(cfg.backoff_base, backoff * 3.0))
             await asyncio.sleep(backoff)
     raise last_error
 
@@ -114,6 +270,46 @@ class RecommendationType(str, Enum):
     upgrades_downgrades = "upgrades_downgrades"
 
 
+# Dispatch tables so the tools do a dict lookup instead of an if/elif
+# chain with a fresh lambda per call; enum values match attribute names
+_FINANCIAL_GETTERS = {
+    financial_type: operator.attrgetter(financial_type.value) for financial_type in FinancialType
+}
+
+_HOLDER_GETTERS = {holder_type: operator.attrgetter(holder_type.value) for holder_type in HolderType}
+
+_HOLDER_SERIALIZERS = {
+    HolderType.major_holders: lambda df: df.reset_index(names="metric").to_json(orient="records"),
+    HolderType.institutional_holders: lambda df: df.to_json(orient="records"),
+    HolderType.mutualfund_holders: lambda df: df.to_json(orient="records", date_format="iso"),
+    HolderType.insider_transactions: lambda df: df.to_json(orient="records", date_format="iso"),
+    HolderType.insider_purchases: lambda df: df.to_json(orient="records", date_format="iso"),
+    HolderType.insider_roster_holders: lambda df: df.to_json(
+        orient="records", date_format="iso"
+    ),
+}
+
+
+def _format_news(news_items: list[dict]) -> str:
+    """Render STORY items as text blocks; pure dict/str work kept free of
+    async and pandas so it stays compilable with mypyc/Cython if needed."""
+    # Preallocated to len(news_items) so appends never trigger a resize;
+    # skipped non-STORY slots are trimmed before the join
+    parts: list = [None] * len(news_items)
+    count = 0
+    for item in news_items:
+        content: dict = item.get("content") or {}
+        if content.get("contentType", "") != "STORY":
+            continue
+        title: str = content.get("title", "")
+        summary: str = content.get("summary", "")
+        description: str = content.get("description", "")
+        url: str = (content.get("canonicalUrl") or {}).get("url", "")
+        parts[count] = f"Title: {title}\nSummary: {summary}\nDescription: {description}\nURL: {url}"
+        count += 1
+    return "\n\n".join(parts[:count])
+
+
 # Initialize FastMCP server
 yfinance_server = FastMCP(
     "yfinance",
@@ -124,6 +320,7 @@ This server is used to get information about a given ticker symbol from yahoo fi
 
 Available tools:
 - get_historical_stock_prices: Get historical stock prices for a given ticker symbol from yahoo finance. Include the following information: Date, Open, High, Low, Close, Volume, Adj Close.
+- get_historical_stock_prices_batch: Get historical stock prices for several ticker symbols in a single call.
 - get_stock_info: Get stock information for a given ticker symbol from yahoo finance. Include the following information: Stock Price & Trading Info, Company Information, Financial Metrics, Earnings & Revenue, Margins & Returns, Dividends, Balance Sheet, Ownership, Analyst Coverage, Risk Metrics, Other.
 - get_yahoo_finance_news: Get news for a given ticker symbol from yahoo finance.
 - get_stock_actions: Get stock dividends and stock splits for a given ticker symbol from yahoo finance.
@@ -152,6 +349,7 @@ Args:
         Default is "1d"
 """,
 )
+@_cached_tool("getting historical stock prices")
 async def get_historical_stock_prices(
     ticker: str, period: str = "1mo", interval: str = "1d"
 ) -> str:
@@ -169,37 +367,90 @@ async def get_historical_stock_prices(
             Intraday data cannot extend last 60 days
             Default is "1d"
     """
-    cache_key = ("get_historical_stock_prices", ticker, period, interval)
-    cached = _cache_get(cache_key)
-    if cached is not None:
-        return cached
+    company = _get_ticker(ticker)
+    hist_data = await _execute_with_retry(
+        lambda: company.history(period=period, interval=interval)
+    )
+    if hist_data.empty:
+        raise _NegativeResult(f"Company ticker {ticker} not found.")
+    hist_data = hist_data.reset_index(names="Date")
+    return hist_data.to_json(orient="records", date_format="iso")
 
-    rate_limited, message = _rate_limit_check(ticker)
-    if rate_limited:
-        return message or "Rate limited. Try after a while."
 
-    company = yf.Ticker(ticker)
-    try:
-        isin = await _execute_with_retry(lambda: company.isin)
-        if isin is None:
-            print(f"Company ticker {ticker} not found.")
-            return f"Company ticker {ticker} not found."
-    except Exception as e:
-        print(f"Error: getting historical stock prices for {ticker}: {e}")
-        return f"Error: getting historical stock prices for {ticker}: {e}"
-
-    # If the company is found, get the historical data
-    try:
-        hist_data = await _execute_with_retry(
-            lambda: company.history(period=period, interval=interval)
-        )
-    except Exception as e:
-        print(f"Error: getting historical stock prices for {ticker}: {e}")
-        return f"Error: getting historical stock prices for {ticker}: {e}"
-    hist_data = hist_data.reset_index(names="Date")
-    hist_data = hist_data.to_json(orient="records", date_format="iso")
-    _cache_set(cache_key, hist_data)
-    return hist_data
+@yfinance_server.tool(
+    name="get_historical_stock_prices_batch",
+    description="""Get historical stock prices for several ticker symbols from yahoo finance in one call. Returns a JSON object mapping each ticker to its records with Date, Open, High, Low, Close, Volume.
+
+Args:
+    tickers: list[str]
+        The ticker symbols of the stocks to get historical prices for, e.g. ["AAPL", "MSFT"]
+    period : str
+        Valid periods: 1d,5d,1mo,3mo,6mo,1y,2y,5y,10y,ytd,max
+        Default is "1mo"
+    interval : str
+        Valid intervals: 1m,2m,5m,15m,30m,60m,90m,1h,1d,5d,1wk,1mo,3mo
+        Intraday data cannot extend last 60 days
+        Default is "1d"
+""",
+)
+async def get_historical_stock_prices_batch(
+    tickers: list[str], period: str = "1mo", interval: str = "1d"
+) -> str:
+    """Get historical stock prices for several ticker symbols in a single Yahoo call"""
+    # Sorted and de-duplicated so permutations of the same tickers share one
+    # cache entry and coalesce, and so the per-ticker interval applies to
+    # each constituent ticker rather than to the joined list as one key
+    tickers = sorted(set(tickers))
+    cache_key = ("get_historical_stock_prices_batch", tuple(tickers), period, interval)
+
+    async def _fetch() -> str:
+        rate_limited, message = _rate_limit_check(*tickers)
+        if rate_limited:
+            return message or "Rate limited. Try after a while."
+
+        try:
+            data = await _execute_with_retry(
+                lambda: yf.download(
+                    tickers=list(tickers),
+                    period=period,
+                    interval=interval,
+                    group_by="ticker",
+                    threads=True,
+                    progress=False,
+                )
+            )
+        except Exception as e:
+            logger.warning(f"Error: getting historical stock prices for {tickers}: {e}")
+            return f"Error: getting historical stock prices for {tickers}: {e}"
+        if data is None or data.empty:
+            not_found = f"No data found for tickers {tickers}."
+            logger.warning(not_found)
+            await _cache_set_negative(cache_key, not_found)
+            return not_found
+
+        try:
+            results = {}
+            grouped = isinstance(data.columns, pd.MultiIndex)
+            for ticker in tickers:
+                if grouped:
+                    # A failed ticker is simply absent from the grouped columns;
+                    # report it as not found instead of serializing the others
+                    if ticker not in data.columns.get_level_values(0):
+                        results[ticker] = f"Company ticker {ticker} not found."
+                        continue
+                    frame = data[ticker]
+                else:
+                    frame = data
+                frame = frame.dropna(how="all").reset_index(names="Date")
+                results[ticker] = orjson.loads(frame.to_json(orient="records", date_format="iso"))
+            result = orjson.dumps(results).decode()
+        except Exception as e:
+            logger.warning(f"Error: getting historical stock prices for {tickers}: {e}")
+            return f"Error: getting historical stock prices for {tickers}: {e}"
+        await _cache_set(cache_key, result)
+        return result
+
+    return await _cached_or_fetch(cache_key, _fetch)
 
 
 @yfinance_server.tool(
@@ -212,34 +463,14 @@ Args:
         The ticker symbol of the stock to get information for, e.g. "AAPL"
 """,
 )
+@_cached_tool("getting stock information")
 async def get_stock_info(ticker: str) -> str:
     """Get stock information for a given ticker symbol"""
-    cache_key = ("get_stock_info", ticker)
-    cached = _cache_get(cache_key)
-    if cached is not None:
-        return cached
-
-    rate_limited, message = _rate_limit_check(ticker)
-    if rate_limited:
-        return message or "Rate limited. Try after a while."
-
-    company = yf.Ticker(ticker)
-    try:
-        isin = await _execute_with_retry(lambda: company.isin)
-        if isin is None:
-            print(f"Company ticker {ticker} not found.")
-            return f"Company ticker {ticker} not found."
-    except Exception as e:
-        print(f"Error: getting stock information for {ticker}: {e}")
-        return f"Error: getting stock information for {ticker}: {e}"
-    try:
-        info = await _execute_with_retry(lambda: company.info)
-    except Exception as e:
-        print(f"Error: getting stock information for {ticker}: {e}")
-        return f"Error: getting stock information for {ticker}: {e}"
-    result = json.dumps(info)
-    _cache_set(cache_key, result)
-    return result
+    company = _get_ticker(ticker)
+    info = await _execute_with_retry(lambda: company.info)
+    if not info:
+        raise _NegativeResult(f"Company ticker {ticker} not found.")
+    return orjson.dumps(info).decode()
 
 
 @yfinance_server.tool(
@@ -251,6 +482,7 @@ Args:
         The ticker symbol of the stock to get news for, e.g. "AAPL"
 """,
 )
+@_cached_tool("getting news")
 async def get_yahoo_finance_news(ticker: str) -> str:
     """Get news for a given ticker symbol
 
@@ -258,47 +490,12 @@ async def get_yahoo_finance_news(ticker: str) -> str:
         ticker: str
             The ticker symbol of the stock to get news for, e.g. "AAPL"
     """
-    cache_key = ("get_yahoo_finance_news", ticker)
-    cached = _cache_get(cache_key)
-    if cached is not None:
-        return cached
-
-    rate_limited, message = _rate_limit_check(ticker)
-    if rate_limited:
-        return message or "Rate limited. Try after a while."
+    company = _get_ticker(ticker)
+    news = await _execute_with_retry(lambda: company.news)
 
-    company = yf.Ticker(ticker)
-    try:
-        isin = await _execute_with_retry(lambda: company.isin)
-        if isin is None:
-            print(f"Company ticker {ticker} not found.")
-            return f"Company ticker {ticker} not found."
-    except Exception as e:
-        print(f"Error: getting news for {ticker}: {e}")
-        return f"Error: getting news for {ticker}: {e}"
-
-    # If the company is found, get the news
-    try:
-        news = await _execute_with_retry(lambda: company.news)
-    except Exception as e:
-        print(f"Error: getting news for {ticker}: {e}")
-        return f"Error: getting news for {ticker}: {e}"
-
-    news_list = []
-    for news in news:
-        if news.get("content", {}).get("contentType", "") == "STORY":
-            title = news.get("content", {}).get("title", "")
-            summary = news.get("content", {}).get("summary", "")
-            description = news.get("content", {}).get("description", "")
-            url = news.get("content", {}).get("canonicalUrl", {}).get("url", "")
-            news_list.append(
-                f"Title: {title}\nSummary: {summary}\nDescription: {description}\nURL: {url}"
-            )
-    if not news_list:
-        print(f"No news found for company that searched with {ticker} ticker.")
-        return f"No news found for company that searched with {ticker} ticker."
-    result = "\n\n".join(news_list)
-    _cache_set(cache_key, result)
+    result = _format_news(news)
+    if not result:
+        raise _NegativeResult(f"No news found for company that searched with {ticker} ticker.")
     return result
 
 
@@ -311,31 +508,13 @@ Args:
         The ticker symbol of the stock to get stock actions for, e.g. "AAPL"
 """,
 )
+@_cached_tool("getting stock actions")
 async def get_stock_actions(ticker: str) -> str:
     """Get stock dividends and stock splits for a given ticker symbol"""
-    cache_key = ("get_stock_actions", ticker)
-    cached = _cache_get(cache_key)
-    if cached is not None:
-        return cached
-
-    rate_limited, message = _rate_limit_check(ticker)
-    if rate_limited:
-        return message or "Rate limited. Try after a while."
-
-    try:
-        company = yf.Ticker(ticker)
-    except Exception as e:
-        print(f"Error: getting stock actions for {ticker}: {e}")
-        return f"Error: getting stock actions for {ticker}: {e}"
-    try:
-        actions_df = await _execute_with_retry(lambda: company.actions)
-    except Exception as e:
-        print(f"Error: getting stock actions for {ticker}: {e}")
-        return f"Error: getting stock actions for {ticker}: {e}"
+    company = _get_ticker(ticker)
+    actions_df = await _execute_with_retry(lambda: company.actions)
     actions_df = actions_df.reset_index(names="Date")
-    result = actions_df.to_json(orient="records", date_format="iso")
-    _cache_set(cache_key, result)
-    return result
+    return actions_df.to_json(orient="records", date_format="iso")
 
 
 @yfinance_server.tool(
@@ -349,71 +528,27 @@ Args:
         The type of financial statement to get. You can choose from the following financial statement types: income_stmt, quarterly_income_stmt, balance_sheet, quarterly_balance_sheet, cashflow, quarterly_cashflow.
 """,
 )
+@_cached_tool("getting financial statement")
 async def get_financial_statement(ticker: str, financial_type: str) -> str:
     """Get financial statement for a given ticker symbol"""
-    cache_key = ("get_financial_statement", ticker, financial_type)
-    cached = _cache_get(cache_key)
-    if cached is not None:
-        return cached
-
-    rate_limited, message = _rate_limit_check(ticker)
-    if rate_limited:
-        return message or "Rate limited. Try after a while."
+    company = _get_ticker(ticker)
 
-    company = yf.Ticker(ticker)
-    try:
-        isin = await _execute_with_retry(lambda: company.isin)
-        if isin is None:
-            print(f"Company ticker {ticker} not found.")
-            return f"Company ticker {ticker} not found."
-    except Exception as e:
-        print(f"Error: getting financial statement for {ticker}: {e}")
-        return f"Error: getting financial statement for {ticker}: {e}"
-
-    if financial_type == FinancialType.income_stmt:
-        fetcher = lambda: company.income_stmt
-    elif financial_type == FinancialType.quarterly_income_stmt:
-        fetcher = lambda: company.quarterly_income_stmt
-    elif financial_type == FinancialType.balance_sheet:
-        fetcher = lambda: company.balance_sheet
-    elif financial_type == FinancialType.quarterly_balance_sheet:
-        fetcher = lambda: company.quarterly_balance_sheet
-    elif financial_type == FinancialType.cashflow:
-        fetcher = lambda: company.cashflow
-    elif financial_type == FinancialType.quarterly_cashflow:
-        fetcher = lambda: company.quarterly_cashflow
-    else:
+    getter = _FINANCIAL_GETTERS.get(financial_type)
+    if getter is None:
         return f"Error: invalid financial type {financial_type}. Please use one of the following: {FinancialType.income_stmt}, {FinancialType.quarterly_income_stmt}, {FinancialType.balance_sheet}, {FinancialType.quarterly_balance_sheet}, {FinancialType.cashflow}, {FinancialType.quarterly_cashflow}."
 
-    try:
-        financial_statement = await _execute_with_retry(fetcher)
-    except Exception as e:
-        print(f"Error: getting financial statement for {ticker}: {e}")
-        return f"Error: getting financial statement for {ticker}: {e}"
-
-    # Create a list to store all the json objects
-    result = []
-
-    # Loop through each column (date)
-    for column in financial_statement.columns:
-        if isinstance(column, pd.Timestamp):
-            date_str = column.strftime("%Y-%m-%d")  # Format as YYYY-MM-DD
-        else:
-            date_str = str(column)
+    financial_statement = await _execute_with_retry(getter, company)
+    if financial_statement.empty:
+        raise _NegativeResult(f"Company ticker {ticker} not found.")
 
-        # Create a dictionary for each date
-        date_obj = {"date": date_str}
-
-        # Add each metric as a key-value pair
-        for index, value in financial_statement[column].items():
-            # Add the value, handling NaN values
-            date_obj[index] = None if pd.isna(value) else value
-
-        result.append(date_obj)
-
-    result_json = json.dumps(result)
-    _cache_set(cache_key, result_json)
-    return result_json
+    # One record per column (date); to_json renders NaN as null in C
+    records = financial_statement.T.reset_index(names="date")
+    records["date"] = records["date"].map(
+        lambda column: (
+            column.strftime("%Y-%m-%d") if isinstance(column, pd.Timestamp) else str(column)
+        )
+    )
+    return records.to_json(orient="records")
 
 
 @yfinance_server.tool(
@@ -427,90 +562,18 @@ Args:
         The type of holder information to get. You can choose from the following holder types: major_holders, institutional_holders, mutualfund_holders, insider_transactions, insider_purchases, insider_roster_holders.
 """,
 )
+@_cached_tool("getting holder info")
 async def get_holder_info(ticker: str, holder_type: str) -> str:
     """Get holder information for a given ticker symbol"""
-    cache_key = ("get_holder_info", ticker, holder_type)
-    cached = _cache_get(cache_key)
-    if cached is not None:
-        return cached
-
-    rate_limited, message = _rate_limit_check(ticker)
-    if rate_limited:
-        return message or "Rate limited. Try after a while."
+    company = _get_ticker(ticker)
 
-    company = yf.Ticker(ticker)
-    try:
-        isin = await _execute_with_retry(lambda: company.isin)
-        if isin is None:
-            print(f"Company ticker {ticker} not found.")
-            return f"Company ticker {ticker} not found."
-    except Exception as e:
-        print(f"Error: getting holder info for {ticker}: {e}")
-        return f"Error: getting holder info for {ticker}: {e}"
-
-    if holder_type == HolderType.major_holders:
-        try:
-            result = await _execute_with_retry(
-                lambda: company.major_holders.reset_index(names="metric").to_json(
-                    orient="records"
-                )
-            )
-        except Exception as e:
-            print(f"Error: getting holder info for {ticker}: {e}")
-            return f"Error: getting holder info for {ticker}: {e}"
-    elif holder_type == HolderType.institutional_holders:
-        try:
-            result = await _execute_with_retry(
-                lambda: company.institutional_holders.to_json(orient="records")
-            )
-        except Exception as e:
-            print(f"Error: getting holder info for {ticker}: {e}")
-            return f"Error: getting holder info for {ticker}: {e}"
-    elif holder_type == HolderType.mutualfund_holders:
-        try:
-            result = await _execute_with_retry(
-                lambda: company.mutualfund_holders.to_json(
-                    orient="records", date_format="iso"
-                )
-            )
-        except Exception as e:
-            print(f"Error: getting holder info for {ticker}: {e}")
-            return f"Error: getting holder info for {ticker}: {e}"
-    elif holder_type == HolderType.insider_transactions:
-        try:
-            result = await _execute_with_retry(
-                lambda: company.insider_transactions.to_json(
-                    orient="records", date_format="iso"
-                )
-            )
-        except Exception as e:
-            print(f"Error: getting holder info for {ticker}: {e}")
-            return f"Error: getting holder info for {ticker}: {e}"
-    elif holder_type == HolderType.insider_purchases:
-        try:
-            result = await _execute_with_retry(
-                lambda: company.insider_purchases.to_json(
-                    orient="records", date_format="iso"
-                )
-            )
-        except Exception as e:
-            print(f"Error: getting holder info for {ticker}: {e}")
-            return f"Error: getting holder info for {ticker}: {e}"
-    elif holder_type == HolderType.insider_roster_holders:
-        try:
-            result = await _execute_with_retry(
-                lambda: company.insider_roster_holders.to_json(
-                    orient="records", date_format="iso"
-                )
-            )
-        except Exception as e:
-            print(f"Error: getting holder info for {ticker}: {e}")
-            return f"Error: getting holder info for {ticker}: {e}"
-    else:
+    serializer = _HOLDER_SERIALIZERS.get(holder_type)
+    if serializer is None:
         return f"Error: invalid holder type {holder_type}. Please use one of the following: {HolderType.major_holders}, {HolderType.institutional_holders}, {HolderType.mutualfund_holders}, {HolderType.insider_transactions}, {HolderType.insider_purchases}, {HolderType.insider_roster_holders}."
-
-    _cache_set(cache_key, result)
-    return result
+    holders = await _execute_with_retry(_HOLDER_GETTERS[holder_type], company)
+    if holders is None or holders.empty:
+        raise _NegativeResult(f"Company ticker {ticker} not found.")
+    return serializer(holders)
 
 
 @yfinance_server.tool(
@@ -522,34 +585,14 @@ Args:
         The ticker symbol of the stock to get option expiration dates for, e.g. "AAPL"
 """,
 )
+@_cached_tool("getting option expiration dates")
 async def get_option_expiration_dates(ticker: str) -> str:
     """Fetch the available options expiration dates for a given ticker symbol."""
-    cache_key = ("get_option_expiration_dates", ticker)
-    cached = _cache_get(cache_key)
-    if cached is not None:
-        return cached
-
-    rate_limited, message = _rate_limit_check(ticker)
-    if rate_limited:
-        return message or "Rate limited. Try after a while."
-
-    company = yf.Ticker(ticker)
-    try:
-        isin = await _execute_with_retry(lambda: company.isin)
-        if isin is None:
-            print(f"Company ticker {ticker} not found.")
-            return f"Company ticker {ticker} not found."
-    except Exception as e:
-        print(f"Error: getting option expiration dates for {ticker}: {e}")
-        return f"Error: getting option expiration dates for {ticker}: {e}"
-    try:
-        options = await _execute_with_retry(lambda: company.options)
-    except Exception as e:
-        print(f"Error: getting option expiration dates for {ticker}: {e}")
-        return f"Error: getting option expiration dates for {ticker}: {e}"
-    result = json.dumps(options)
-    _cache_set(cache_key, result)
-    return result
+    company = _get_ticker(ticker)
+    options = await _execute_with_retry(lambda: company.options)
+    if not options:
+        raise _NegativeResult(f"Company ticker {ticker} not found.")
+    return orjson.dumps(options).decode()
 
 
 @yfinance_server.tool(
@@ -565,6 +608,7 @@ Args:
         The type of option to fetch ('calls' or 'puts')
 """,
 )
+@_cached_tool("getting option chain")
 async def get_option_chain(ticker: str, expiration_date: str, option_type: str) -> str:
     """Fetch the option chain for a given ticker symbol, expiration date, and option type.
 
@@ -576,55 +620,31 @@ async def get_option_chain(ticker: str, expiration_date: str, option_type: str)
     Returns:
         str: JSON string containing the option chain data
     """
+    company = _get_ticker(ticker)
 
-    cache_key = ("get_option_chain", ticker, expiration_date, option_type)
-    cached = _cache_get(cache_key)
-    if cached is not None:
-        return cached
-
-    rate_limited, message = _rate_limit_check(ticker)
-    if rate_limited:
-        return message or "Rate limited. Try after a while."
+    # Check if the option type is valid
+    if option_type not in ["calls", "puts"]:
+        return "Error: Invalid option type. Please use 'calls' or 'puts'."
 
-    company = yf.Ticker(ticker)
-    try:
-        isin = await _execute_with_retry(lambda: company.isin)
-        if isin is None:
-            print(f"Company ticker {ticker} not found.")
-            return f"Company ticker {ticker} not found."
-    except Exception as e:
-        print(f"Error: getting option chain for {ticker}: {e}")
-        return f"Error: getting option chain for {ticker}: {e}"
+    # Fetch the expiration list and the chain concurrently so the latency
+    # on cache miss is the slower of the two round-trips, not their sum
+    options, option_chain = await asyncio.gather(
+        _execute_with_retry(lambda: company.options),
+        _execute_with_retry(lambda: company.option_chain(expiration_date)),
+        return_exceptions=True,
+    )
+    if isinstance(options, BaseException):
+        raise options
 
     # Check if the expiration date is valid
-    try:
-        options = await _execute_with_retry(lambda: company.options)
-    except Exception as e:
-        print(f"Error: getting option chain for {ticker}: {e}")
-        return f"Error: getting option chain for {ticker}: {e}"
-
     if expiration_date not in options:
         return f"Error: No options available for the date {expiration_date}. You can use `get_option_expiration_dates` to get the available expiration dates."
+    if isinstance(option_chain, BaseException):
+        raise option_chain
 
-    # Check if the option type is valid
-    if option_type not in ["calls", "puts"]:
-        return "Error: Invalid option type. Please use 'calls' or 'puts'."
-
-    # Get the option chain
-    try:
-        option_chain = await _execute_with_retry(lambda: company.option_chain(expiration_date))
-    except Exception as e:
-        print(f"Error: getting option chain for {ticker}: {e}")
-        return f"Error: getting option chain for {ticker}: {e}"
     if option_type == "calls":
-        result = option_chain.calls.to_json(orient="records", date_format="iso")
-    elif option_type == "puts":
-        result = option_chain.puts.to_json(orient="records", date_format="iso")
-    else:
-        return f"Error: invalid option type {option_type}. Please use one of the following: calls, puts."
-
-    _cache_set(cache_key, result)
-    return result
+        return option_chain.calls.to_json(orient="records", date_format="iso")
+    return option_chain.puts.to_json(orient="records", date_format="iso")
 
 
 @yfinance_server.tool(
@@ -640,54 +660,36 @@ Args:
         The number of months back to get upgrades/downgrades for, default is 12.
 """,
 )
+@_cached_tool("getting recommendations")
 async def get_recommendations(ticker: str, recommendation_type: str, months_back: int = 12) -> str:
     """Get recommendations or upgrades/downgrades for a given ticker symbol"""
-    cache_key = ("get_recommendations", ticker, recommendation_type, months_back)
-    cached = _cache_get(cache_key)
-    if cached is not None:
-        return cached
-
-    rate_limited, message = _rate_limit_check(ticker)
-    if rate_limited:
-        return message or "Rate limited. Try after a while."
-
-    company = yf.Ticker(ticker)
-    try:
-        isin = await _execute_with_retry(lambda: company.isin)
-        if isin is None:
-            print(f"Company ticker {ticker} not found.")
-            return f"Company ticker {ticker} not found."
-    except Exception as e:
-        print(f"Error: getting recommendations for {ticker}: {e}")
-        return f"Error: getting recommendations for {ticker}: {e}"
-    try:
-        if recommendation_type == RecommendationType.recommendations:
-            result = await _execute_with_retry(
-                lambda: company.recommendations.to_json(orient="records")
-            )
-            _cache_set(cache_key, result)
-            return result
-        elif recommendation_type == RecommendationType.upgrades_downgrades:
-            # Get the upgrades/downgrades based on the cutoff date
-            upgrades_downgrades = await _execute_with_retry(
-                lambda: company.upgrades_downgrades.reset_index()
-            )
-            cutoff_date = pd.Timestamp.now() - pd.DateOffset(months=months_back)
-            upgrades_downgrades = upgrades_downgrades[
-                upgrades_downgrades["GradeDate"] >= cutoff_date
-            ]
-            upgrades_downgrades = upgrades_downgrades.sort_values("GradeDate", ascending=False)
-            # Get the first occurrence (most recent) for each firm
-            latest_by_firm = upgrades_downgrades.drop_duplicates(subset=["Firm"])
-            result = latest_by_firm.to_json(orient="records", date_format="iso")
-            _cache_set(cache_key, result)
-            return result
-    except Exception as e:
-        print(f"Error: getting recommendations for {ticker}: {e}")
-        return f"Error: getting recommendations for {ticker}: {e}"
+    company = _get_ticker(ticker)
+    if recommendation_type == RecommendationType.recommendations:
+        recommendations = await _execute_with_retry(lambda: company.recommendations)
+        if recommendations is None or recommendations.empty:
+            raise _NegativeResult(f"Company ticker {ticker} not found.")
+        return recommendations.to_json(orient="records")
+    elif recommendation_type == RecommendationType.upgrades_downgrades:
+        # Get the upgrades/downgrades based on the cutoff date
+        upgrades_downgrades = await _execute_with_retry(
+            lambda: company.upgrades_downgrades
+        )
+        if upgrades_downgrades is None or upgrades_downgrades.empty:
+            raise _NegativeResult(f"Company ticker {ticker} not found.")
+        upgrades_downgrades = upgrades_downgrades.reset_index()
+        cutoff_date = pd.Timestamp.now() - pd.DateOffset(months=months_back)
+        upgrades_downgrades = upgrades_downgrades[
+            upgrades_downgrades["GradeDate"] >= cutoff_date
+        ]
+        upgrades_downgrades = upgrades_downgrades.sort_values("GradeDate", ascending=False)
+        # Get the first occurrence (most recent) for each firm
+        latest_by_firm = upgrades_downgrades.drop_duplicates(subset=["Firm"])
+        return latest_by_firm.to_json(orient="records", date_format="iso")
+    else:
+        return f"Error: invalid recommendation type {recommendation_type}. Please use one of the following: {RecommendationType.recommendations}, {RecommendationType.upgrades_downgrades}."
 
 
 if __name__ == "__main__":
     # Initialize and run the server
-    print("Starting Yahoo Finance MCP server...")
+    logger.info("Starting Yahoo Finance MCP server...")
     yfinance_server.run(transport="stdio")